@@ -31,6 +31,9 @@ class Config:
     LINKEDIN_ACCESS_TOKEN = os.getenv('LINKEDIN_ACCESS_TOKEN')
     INSTAGRAM_ACCESS_TOKEN = os.getenv('INSTAGRAM_ACCESS_TOKEN')
     
+    # Route Graph/LinkedIn requests over an HTTP/2 client (requires httpx[http2])
+    SOCIAL_HTTP2 = os.getenv('SOCIAL_HTTP2', 'False').lower() == 'true'
+    
     # MCP Configuration
     os.environ['CREWAI_DISABLE_TELEMETRY'] = 'true'
     os.environ['OTEL_SDK_DISABLED'] = 'true'
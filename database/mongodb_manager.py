@@ -6,13 +6,36 @@ from datetime import datetime
 from bson import ObjectId
 from typing import Dict, List, Optional
 import logging
+import threading
 import pytz
 
 logger = logging.getLogger(__name__)
 
+class MongoClientPool:
+    """One MongoClient per URI, shared by every MongoDBManager in the process"""
+    
+    _clients: Dict[Optional[str], MongoClient] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, uri: Optional[str]) -> MongoClient:
+        """Return the shared client for uri, creating it on first use"""
+        with cls._lock:
+            client = cls._clients.get(uri)
+            if client is None:
+                # Keep a warm pool so the first requests don't pay connection setup
+                client = MongoClient(
+                    uri,
+                    minPoolSize=10,
+                    maxPoolSize=100,
+                    maxIdleTimeMS=60000
+                )
+                cls._clients[uri] = client
+            return client
+
 class MongoDBManager:
     def __init__(self):
-        self.client = MongoClient(os.getenv('MONGODB_URI'))
+        self.client = MongoClientPool.get(os.getenv('MONGODB_URI'))
         self.db = self.client.content_system
         
         # Collections
@@ -24,6 +47,10 @@ class MongoDBManager:
         # Create indexes
         self._create_indexes()
     
+    def ping(self):
+        """Round-trip to the server to establish the first pooled connection"""
+        self.client.admin.command('ping')
+    
     def _create_indexes(self):
         """Create database indexes for better performance"""
         try:
@@ -5,6 +5,7 @@ import hashlib
 import json
 from typing import List, Dict, Any
 
+import httpx
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
 
@@ -14,7 +15,9 @@ class QdrantManager:
     def __init__(self):
         self.client = QdrantClient(
             url=os.getenv('QDRANT_URL'),
-            api_key=os.getenv('QDRANT_API_KEY')
+            api_key=os.getenv('QDRANT_API_KEY'),
+            # Forwarded to the REST client's httpx pool
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
         )
         self.vector_size = 1536  # OpenAI embedding size
 
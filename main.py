@@ -1,5 +1,6 @@
 
 import os
+import atexit
 from dotenv import load_dotenv
 from flask import Flask, request, jsonify, render_template_string, redirect, send_from_directory
 from datetime import datetime, timedelta
@@ -36,6 +37,8 @@ app.config['ASYNC_MODE'] = True
 mongodb_manager = MongoDBManager()
 qdrant_manager = QdrantManager()
 social_media_service = SocialMediaService()
+# Close its HTTP clients and I/O loop thread when the process exits
+atexit.register(social_media_service.close)
 scheduler_service = SchedulerService(mongodb_manager=mongodb_manager, social_media_service=social_media_service)
 image_service = ImageService("static/images")
 mcp_server = MCPServer()
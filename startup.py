@@ -1,6 +1,7 @@
 import os
 import sys
 import asyncio
+import importlib.util
 import threading
 import signal
 from pathlib import Path
@@ -11,24 +12,50 @@ sys.path.insert(0, str(project_root))
 
 from config.settings import Config
 from utils.logging_config import setup_logging
-from database.mongodb_manager import MongoDBManager
-from database.qdrant_manager import QdrantManager
-from agents.crew_agents import ContentCrewManager
-from services.social_media_service import SocialMediaService
-from services.scheduler_service import SchedulerService
-from services.image_service import ImageService
-from mcp.mcp_server import MCPServer
-from main import app
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _lazy(name):
+    """Import a module whose body only runs on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# The heaviest import graphs: CrewAI/LangChain/OpenAI, and the Flask app,
+# whose module body builds its own service instances
+crew_agents = _lazy('agents.crew_agents')
+main_module = _lazy('main')
+
 class ContentGenerationSystem:
     """Main system orchestrator"""
     
+    __slots__ = (
+        'running', 'app', 'server', 'stop_event',
+        'mongodb', 'qdrant', 'crew_manager', 'social_media',
+        'image_service', 'scheduler', 'mcp_server'
+    )
+    
     def __init__(self):
         self.running = False
-        self.services = {}
+        self.mongodb = None
+        self.qdrant = None
+        self.crew_manager = None
+        self.social_media = None
+        self.image_service = None
+        self.scheduler = None
+        self.mcp_server = None
+        self.app = None
+        self.server = None
+        self.stop_event = None
         
         # Setup logging
         setup_logging(Config.LOG_LEVEL, Config.LOG_FILE)
@@ -45,42 +72,53 @@ class ContentGenerationSystem:
     async def initialize_services(self):
         """Initialize all services"""
         try:
-            # Initialize database managers
-            logger.info("Initializing database connections...")
-            self.services['mongodb'] = MongoDBManager()
-            self.services['qdrant'] = QdrantManager()
+            # Service modules (CrewAI, OpenAI, Flask...) are imported here rather
+            # than at module load so configuration errors fail fast
+            from database.mongodb_manager import MongoDBManager
+            from database.qdrant_manager import QdrantManager
+            from services.social_media_service import SocialMediaService
+            from services.scheduler_service import SchedulerService
+            from services.image_service import ImageService
+            from mcp.mcp_server import MCPServer
+
+            # Construct independent services concurrently; their constructors
+            # block on network I/O (Mongo index creation, Qdrant, API clients)
+            logger.info("Initializing database connections and social media services...")
+            self.mongodb, self.qdrant, self.social_media = await asyncio.gather(
+                asyncio.to_thread(MongoDBManager),
+                asyncio.to_thread(QdrantManager),
+                asyncio.to_thread(SocialMediaService)
+            )
+            self.image_service = ImageService(Config.IMAGE_FOLDER)
             
-            # Initialize AI services
+            # Initialize AI services while the Mongo pool warms up
             logger.info("Initializing AI services...")
-            self.services['crew_manager'] = ContentCrewManager(
-                openai_api_key=Config.OPENAI_API_KEY,
-                qdrant_manager=self.services['qdrant'],
-                mongodb_manager=self.services['mongodb']
+            self.crew_manager, _ = await asyncio.gather(
+                asyncio.to_thread(self._build_crew_manager),
+                asyncio.to_thread(self._warm_mongodb)
             )
             
-            # Initialize social media services
-            logger.info("Initializing social media services...")
-            self.services['social_media'] = SocialMediaService()
-            self.services['image_service'] = ImageService(Config.IMAGE_FOLDER)
-            
             # Initialize scheduler
             logger.info("Initializing scheduler...")
-            self.services['scheduler'] = SchedulerService(
-                mongodb_manager=self.services['mongodb'],
-                social_media_service=self.services['social_media']
+            self.scheduler = SchedulerService(
+                mongodb_manager=self.mongodb,
+                social_media_service=self.social_media
             )
             
             # Initialize MCP server
             logger.info("Initializing MCP server...")
-            self.services['mcp_server'] = MCPServer(Config.MCP_HOST, Config.MCP_PORT)
+            self.mcp_server = MCPServer(Config.MCP_HOST, Config.MCP_PORT)
             
-            # Update Flask app with services
-            app.mongodb_manager = self.services['mongodb']
-            app.qdrant_manager = self.services['qdrant']
-            app.crew_manager = self.services['crew_manager']
-            app.social_media_service = self.services['social_media']
-            app.scheduler_service = self.services['scheduler']
-            app.mcp_server = self.services['mcp_server']
+            # Update Flask app with services. The first access runs main's module
+            # body (which builds its own services), so keep it off the loop
+            app = await asyncio.to_thread(getattr, main_module, 'app')
+            app.mongodb_manager = self.mongodb
+            app.qdrant_manager = self.qdrant
+            app.crew_manager = self.crew_manager
+            app.social_media_service = self.social_media
+            app.scheduler_service = self.scheduler
+            app.mcp_server = self.mcp_server
+            self.app = app
             
             logger.info("All services initialized successfully")
             
@@ -88,15 +126,30 @@ class ContentGenerationSystem:
             logger.error(f"Error initializing services: {e}")
             raise
     
+    def _build_crew_manager(self):
+        """Construct the crew manager; the first attribute access runs crew_agents' imports"""
+        return crew_agents.ContentCrewManager(
+            openai_api_key=Config.OPENAI_API_KEY,
+            qdrant_manager=self.qdrant,
+            mongodb_manager=self.mongodb
+        )
+    
+    def _warm_mongodb(self):
+        """Best-effort ping to fill the Mongo pool; startup continues without it"""
+        try:
+            self.mongodb.ping()
+        except Exception as e:
+            logger.warning(f"MongoDB warm-up ping failed: {e}")
+    
     def start_background_services(self):
         """Start background services"""
         try:
             # Start scheduler
-            self.services['scheduler'].start()
+            self.scheduler.start()
             logger.info("Scheduler service started")
             
             # Start MCP server
-            self.services['mcp_server'].start()
+            self.mcp_server.start()
             logger.info("MCP server started")
             
         except Exception as e:
@@ -105,25 +158,33 @@ class ContentGenerationSystem:
     
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
+        loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
+        
+        def signal_handler(signum):
             logger.info(f"Received signal {signum}, shutting down gracefully...")
-            self.shutdown()
-            sys.exit(0)
+            self.stop_event.set()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, signal_handler, signum)
     
-    async def start(self):
-        """Start the entire system"""
+    async def __aenter__(self):
+        """Initialize and start all services"""
+        self.running = True
         try:
-            self.running = True
-            
-            # Initialize services
             await self.initialize_services()
-            
-            # Start background services
             self.start_background_services()
-            
+        except Exception:
+            await self.shutdown()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.shutdown()
+    
+    async def start(self):
+        """Serve the web interface until shutdown"""
+        try:
             # Setup signal handlers
             self.setup_signal_handlers()
             
@@ -131,12 +192,19 @@ class ContentGenerationSystem:
             logger.info(f"Web interface available at http://{Config.FLASK_HOST}:{Config.FLASK_PORT}")
             logger.info(f"MCP server running on {Config.MCP_HOST}:{Config.MCP_PORT}")
             
-            # Start Flask app
-            app.run(
-                host=Config.FLASK_HOST,
-                port=Config.FLASK_PORT,
-                debug=Config.FLASK_DEBUG
-            )
+            # Serve Flask from a worker thread so the event loop stays free
+            # to handle signals and shutdown
+            from werkzeug.serving import make_server
+            self.app.debug = Config.FLASK_DEBUG
+            self.server = make_server(Config.FLASK_HOST, Config.FLASK_PORT, self.app, threaded=True)
+            serve_task = asyncio.create_task(asyncio.to_thread(self.server.serve_forever))
+            stop_task = asyncio.create_task(self.stop_event.wait())
+            
+            # Run until a signal arrives (or the server dies), then drain
+            await asyncio.wait((serve_task, stop_task), return_when=asyncio.FIRST_COMPLETED)
+            stop_task.cancel()
+            await self.shutdown()
+            await serve_task
             
         except Exception as e:
             logger.error(f"Error starting system: {e}")
@@ -152,16 +220,30 @@ class ContentGenerationSystem:
         self.running = False
         
         try:
+            # Stop web server; serve_forever() returns in its own thread
+            if self.server is not None:
+                await asyncio.to_thread(self.server.shutdown)
+                self.server.server_close()
+                logger.info("Web server stopped")
+            
             # Stop scheduler
-            if 'scheduler' in self.services:
-                self.services['scheduler'].stop()
+            if self.scheduler is not None:
+                self.scheduler.stop()
                 logger.info("Scheduler stopped")
             
             # Stop MCP server
-            if 'mcp_server' in self.services:
-                self.services['mcp_server'].stop()
+            if self.mcp_server is not None:
+                self.mcp_server.stop()
                 logger.info("MCP server stopped")
-            
+
+            # Close social media HTTP connections
+            if self.social_media is not None:
+                await self.social_media.aclose()
+                logger.info("Social media connections closed")
+            # The Flask views post through main.py's own instance
+            if self.app is not None:
+                await main_module.social_media_service.aclose()
+
             logger.info("Content Generation System shutdown complete")
             
         except Exception as e:
@@ -173,14 +255,13 @@ async def main():
     system = ContentGenerationSystem()
     
     try:
-        await system.start()
+        async with system:
+            await system.start()
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")
     except Exception as e:
         logger.error(f"System error: {e}")
         sys.exit(1)
-    finally:
-        await system.shutdown()
 
 
 if __name__ == "__main__":
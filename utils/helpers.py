@@ -1,60 +1,93 @@
+import functools
 import hashlib
 import json
 import re
-from datetime import datetime, timedelta
+import secrets
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
-import uuid
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # ciso8601 is optional; fall back to datetime.fromisoformat
+    def _parse_iso(value: str) -> datetime:
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+_HASHTAG_RE = re.compile(r'#\w+')
+
+# Hard length limits used by sanitize_content
+_PLATFORM_MAX_LEN = {'twitter': 280, 'linkedin': 3000, 'facebook': 2000, 'instagram': 2200}
+_DEFAULT_MAX = 280
+
+# Analytics fields shown in reports, with their defaults, in display order
+_ANALYTICS_KEYS = (
+    ('engagement_rate', 0),
+    ('total_engagement', 0),
+    ('impressions', 0),
+    ('clicks', 0),
+    ('shares', 0),
+    ('comments', 0),
+    ('likes', 0)
+)
+
+# Bound here because calculate_optimal_posting_time's `timezone` argument shadows the module
+_UTC = timezone.utc
 
 def generate_content_id() -> str:
     """Generate unique content ID"""
-    return f"content_{uuid.uuid4().hex[:8]}"
+    return f"content_{secrets.token_hex(4)}"
 
 def generate_project_id() -> str:
     """Generate unique project ID"""
-    return f"project_{uuid.uuid4().hex[:8]}"
+    return f"project_{secrets.token_hex(4)}"
 
 def sanitize_content(content: str, platform: str) -> str:
     """Sanitize content for specific platform"""
-    platform_configs = {
-        'twitter': {'max_length': 280},
-        'linkedin': {'max_length': 3000},
-        'facebook': {'max_length': 2000},
-        'instagram': {'max_length': 2200}
-    }
-    
-    config = platform_configs.get(platform, {'max_length': 280})
+    max_len = _PLATFORM_MAX_LEN.get(platform, _DEFAULT_MAX)
     
     # Truncate if too long
-    if len(content) > config['max_length']:
-        content = content[:config['max_length'] - 3] + "..."
+    if len(content) > max_len:
+        content = content[:max_len - 3] + "..."
     
     return content
 
 def extract_hashtags(content: str) -> List[str]:
     """Extract hashtags from content"""
-    hashtag_pattern = r'#\w+'
-    hashtags = re.findall(hashtag_pattern, content)
-    return [tag.lower() for tag in hashtags]
+    return [tag.lower() for tag in _HASHTAG_RE.findall(content)]
 
 def validate_schedule_time(schedule_time: str) -> bool:
     """Validate schedule time format"""
     try:
-        datetime.fromisoformat(schedule_time.replace('Z', '+00:00'))
+        _parse_iso(schedule_time)
         return True
     except ValueError:
         return False
 
-def calculate_optimal_posting_time(platform: str, timezone: str = 'UTC') -> str:
-    """Calculate optimal posting time for platform"""
+@functools.lru_cache(maxsize=16)
+def _platform_limits(platform: str) -> tuple:
+    """(max_length, max_hashtags) for a platform; Config is static for the process"""
+    from config.settings import Config
+    
+    cfg = Config.PLATFORM_CONFIGS.get(platform) or {}
+    return cfg.get('max_length', 280), cfg.get('max_hashtags', 3)
+
+@functools.lru_cache(maxsize=16)
+def _parsed_times(platform: str) -> tuple:
+    """Optimal posting times for a platform as (hour, minute) tuples"""
     from config.settings import Config
     
     optimal_times = Config.PLATFORM_CONFIGS.get(platform, {}).get('optimal_posting_times', ['12:00'])
+    return tuple((int(h), int(m)) for h, m in (t.split(':') for t in optimal_times))
+
+def calculate_optimal_posting_time(platform: str, timezone: str = 'UTC') -> str:
+    """Calculate optimal posting time for platform"""
+    optimal_times = _parsed_times(platform)
     
     # Simple logic to pick next available optimal time
-    now = datetime.utcnow()
+    now = datetime.now(_UTC)
     
-    for time_str in optimal_times:
-        hour, minute = map(int, time_str.split(':'))
+    for hour, minute in optimal_times:
         optimal_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
         
         if optimal_time > now:
@@ -62,49 +95,83 @@ def calculate_optimal_posting_time(platform: str, timezone: str = 'UTC') -> str:
     
     # If no time today, schedule for tomorrow's first optimal time
     tomorrow = now + timedelta(days=1)
-    hour, minute = map(int, optimal_times[0].split(':'))
+    hour, minute = optimal_times[0]
     optimal_time = tomorrow.replace(hour=hour, minute=minute, second=0, microsecond=0)
     
     return optimal_time.isoformat()
 
+@functools.lru_cache(maxsize=4096)
 def hash_content(content: str) -> str:
-    """Generate hash for content deduplication"""
-    return hashlib.md5(content.encode()).hexdigest()
+    """Generate hash for content deduplication (128-bit, 32 hex chars)"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=1024)
+def _prefix_hasher(prefix: str):
+    """Hasher already fed with a shared prefix; copy it before updating"""
+    return hashlib.blake2b(prefix.encode('utf-8'), digest_size=16)
+
+def hash_content_with_prefix(prefix: str, tail: str) -> str:
+    """Hash templated content without re-hashing its prefix; equals hash_content(prefix + tail)"""
+    hasher = _prefix_hasher(prefix).copy()
+    hasher.update(tail.encode('utf-8'))
+    return hasher.hexdigest()
 
 def format_analytics_data(data: Dict) -> Dict:
     """Format analytics data for display"""
-    formatted = {
-        'engagement_rate': round(data.get('engagement_rate', 0), 2),
-        'total_engagement': data.get('total_engagement', 0),
-        'impressions': data.get('impressions', 0),
-        'clicks': data.get('clicks', 0),
-        'shares': data.get('shares', 0),
-        'comments': data.get('comments', 0),
-        'likes': data.get('likes', 0)
-    }
+    formatted = {key: data.get(key, default) for key, default in _ANALYTICS_KEYS}
+    formatted['engagement_rate'] = round(formatted['engagement_rate'], 2)
     
     return formatted
 
-def validate_platform_content(content: str, platform: str) -> Dict:
-    """Validate content for platform requirements"""
-    from config.settings import Config
-    
-    config = Config.PLATFORM_CONFIGS.get(platform, {})
+def _check_limits(length: int, hashtag_count: int, max_len: int, max_hashtags: int) -> Dict:
+    """Length and hashtag checks shared by the validation helpers"""
     errors = []
     warnings = []
     
     # Length check
-    if len(content) > config.get('max_length', 280):
-        errors.append(f"Content exceeds {config['max_length']} character limit")
+    if length > max_len:
+        errors.append(f"Content exceeds {max_len} character limit")
     
     # Hashtag check
-    hashtags = extract_hashtags(content)
-    max_hashtags = config.get('max_hashtags', 3)
-    if len(hashtags) > max_hashtags:
-        warnings.append(f"Too many hashtags ({len(hashtags)}), recommended: {max_hashtags}")
+    if hashtag_count > max_hashtags:
+        warnings.append(f"Too many hashtags ({hashtag_count}), recommended: {max_hashtags}")
     
     return {
         'valid': len(errors) == 0,
         'errors': errors,
         'warnings': warnings
-    }
\ No newline at end of file
+    }
+
+def validate_platform_content(content: str, platform: str, hashtags: Optional[List[str]] = None) -> Dict:
+    """Validate content for platform requirements"""
+    # Callers that already extracted hashtags can pass them in
+    if hashtags is None:
+        hashtags = extract_hashtags(content)
+    return _check_limits(len(content), len(hashtags), *_platform_limits(platform))
+
+def validate_platform_content_batch(contents: List[str], platforms: List[str]) -> List[Dict]:
+    """Validate many posts at once, resolving each platform's limits only once"""
+    limits = {platform: _platform_limits(platform) for platform in set(platforms)}
+    findall = _HASHTAG_RE.findall
+    
+    return [
+        _check_limits(len(content), len(findall(content)), *limits[platform])
+        for content, platform in zip(contents, platforms, strict=True)
+    ]
+
+def process_for_platform(content: str, platform: str) -> Dict:
+    """Sanitize, extract hashtags and validate in one pass over the content"""
+    # Truncate first so hashtags and checks reflect what will be posted
+    length = len(content)
+    sanitize_len = _PLATFORM_MAX_LEN.get(platform, _DEFAULT_MAX)
+    if length > sanitize_len:
+        content = content[:sanitize_len - 3] + "..."
+        length = sanitize_len
+    
+    hashtags = [tag.lower() for tag in _HASHTAG_RE.findall(content)]
+    
+    return {
+        'content': content,
+        'hashtags': hashtags,
+        **_check_limits(length, len(hashtags), *_platform_limits(platform))
+    }